@@ -0,0 +1,56 @@
+import base64
+from typing import Any
+from typing import Iterator
+from unittest import mock
+
+import boto3
+import pytest
+from typing_extensions import Final
+
+from moto import mock_aws  # isort: skip
+
+mocked_md5_hash: Final = base64.urlsafe_b64encode(b"mocked_md5_hash").decode()
+
+
+@pytest.fixture(scope="module")
+def aws_mock() -> Any:
+    """Create the moto bucket once and keep it for every test in the module."""
+    aws_mock = mock_aws()
+    aws_mock.start()
+    boto3.client("s3", region_name="us-east-1").create_bucket(Bucket="collectfast")
+    aws_mock.stop(remove_data=False)
+    return aws_mock
+
+
+@pytest.fixture
+def aws_bucket(aws_mock: Any) -> Iterator[None]:
+    """Mock AWS for a single test and remove the objects it uploaded."""
+    aws_mock.start(reset=False)
+    try:
+        yield
+        s3 = boto3.client("s3", region_name="us-east-1")
+        objects = s3.list_objects_v2(Bucket="collectfast").get("Contents", [])
+        if objects:
+            s3.delete_objects(
+                Bucket="collectfast",
+                Delete={"Objects": [{"Key": obj["Key"]} for obj in objects]},
+            )
+    finally:
+        aws_mock.stop(remove_data=False)
+
+
+@pytest.fixture(scope="module")
+def gcloud_client() -> mock.MagicMock:
+    """Build the mocked Google Cloud client once for every test in the module."""
+    client = mock.MagicMock()
+    bucket = client.return_value.bucket.return_value
+    properties = bucket.get_blob.return_value._properties
+    properties.__getitem__.return_value = mocked_md5_hash
+    return client
+
+
+@pytest.fixture
+def gcloud_mock(gcloud_client: mock.MagicMock) -> Iterator[mock.MagicMock]:
+    """Patch the Google Cloud client for a single test."""
+    with mock.patch("storages.backends.gcloud.Client", gcloud_client):
+        yield gcloud_client
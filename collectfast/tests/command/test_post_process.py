@@ -4,7 +4,6 @@ from django.contrib.staticfiles.storage import StaticFilesStorage
 from django.test import override_settings as override_django_settings
 
 from collectfast.management.commands.collectstatic import Command
-from collectfast.tests.utils import clean_static_dir
 from collectfast.tests.utils import create_static_file
 from collectfast.tests.utils import override_setting
 
@@ -20,7 +19,6 @@ class MockPostProcessing(StaticFilesStorage):
     STATICFILES_STORAGE="collectfast.tests.command.test_post_process.MockPostProcessing"
 )
 def test_calls_post_process_with_collected_files() -> None:
-    clean_static_dir()
     path = create_static_file()
 
     cmd = Command()
@@ -1,13 +1,11 @@
-import re
-import tempfile
-from unittest import TestCase
+import hashlib
+import io
 from unittest import mock
 
 from django.contrib.staticfiles.storage import StaticFilesStorage
 from django.core.files.storage import FileSystemStorage
 
 from collectfast.strategies.base import HashStrategy
-from collectfast.tests.utils import make_test
 
 
 class Strategy(HashStrategy[FileSystemStorage]):
@@ -18,36 +16,34 @@ class Strategy(HashStrategy[FileSystemStorage]):
         pass
 
 
-@make_test
-def test_get_file_hash(case: TestCase) -> None:
+def test_get_file_hash() -> None:
     strategy = Strategy()
     local_storage = StaticFilesStorage()
 
-    with tempfile.NamedTemporaryFile(dir=local_storage.base_location) as f:
-        f.write(b"spam")
-        hash_ = strategy.get_local_file_hash(f.name, local_storage)
-    case.assertTrue(re.fullmatch(r"^[A-z0-9]{32}$", hash_) is not None)
+    with mock.patch.object(
+        local_storage, "open", return_value=io.BytesIO(b"spam")
+    ) as mocked_open:
+        hash_ = strategy.get_local_file_hash("spam.txt", local_storage)
+    mocked_open.assert_called_once_with("spam.txt")
+    assert hash_ == hashlib.md5(b"spam").hexdigest()
 
 
-@make_test
-def test_should_copy_file(case: TestCase) -> None:
+def test_should_copy_file() -> None:
     strategy = Strategy()
     local_storage = StaticFilesStorage()
-    remote_hash = "foo"
-    mock_remote_hash = mock.patch.object(
-        strategy, "get_remote_file_hash", mock.MagicMock(return_value=remote_hash)
-    )
-
-    with mock_remote_hash:
-        with mock.patch.object(
-            strategy, "get_local_file_hash", mock.MagicMock(return_value=remote_hash)
-        ):
-            case.assertFalse(
-                strategy.should_copy_file("path", "prefixed_path", local_storage)
-            )
-        with mock.patch.object(
-            strategy, "get_local_file_hash", mock.MagicMock(return_value="bar")
-        ):
-            case.assertTrue(
-                strategy.should_copy_file("path", "prefixed_path", local_storage)
-            )
+    remote_hash = mock.MagicMock(return_value="foo")
+    matching_local_hash = mock.MagicMock(return_value="foo")
+    differing_local_hash = mock.MagicMock(return_value="bar")
+
+    with mock.patch.multiple(
+        strategy,
+        get_remote_file_hash=remote_hash,
+        get_local_file_hash=matching_local_hash,
+    ):
+        assert not strategy.should_copy_file("path", "prefixed_path", local_storage)
+    with mock.patch.multiple(
+        strategy,
+        get_remote_file_hash=remote_hash,
+        get_local_file_hash=differing_local_hash,
+    ):
+        assert strategy.should_copy_file("path", "prefixed_path", local_storage)
@@ -1,18 +1,13 @@
-import os
-import shutil
-
 import pytest
-from django.conf import settings
 
 
 @pytest.fixture(autouse=True)
-def create_test_directories():
-    paths = (settings.STATICFILES_DIRS[0], settings.STATIC_ROOT, settings.MEDIA_ROOT)
-    for path in paths:
-        if not os.path.exists(path):
-            os.makedirs(path)
-    try:
-        yield
-    finally:
-        for path in paths:
-            shutil.rmtree(path)
+def create_test_directories(tmp_path, settings):
+    static_dir = tmp_path / "static"
+    static_root = tmp_path / "static_root"
+    media_root = tmp_path / "fs_remote"
+    for path in (static_dir, static_root, media_root):
+        path.mkdir()
+    settings.STATICFILES_DIRS = [str(static_dir)]
+    settings.STATIC_ROOT = str(static_root)
+    settings.MEDIA_ROOT = str(media_root)